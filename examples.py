@@ -8,7 +8,7 @@ import logging
 import sys
 from pathlib import Path
 
-from make_feed.config import Config, configure_logging
+from make_feed.config import configure_logging, get_config
 from make_feed.generate_rss import generate_rss
 from make_feed.pull_notion import fetch_reading_list
 
@@ -18,7 +18,7 @@ def example_basic_usage(logger: logging.Logger) -> None:
     logger.info("Starting basic RSS generation example...")
 
     # Validate configuration
-    config = Config()
+    config = get_config()
     config_errors = config.validate()
     if config_errors:
         logger.error("Configuration validation failed:")
@@ -37,8 +37,8 @@ def example_basic_usage(logger: logging.Logger) -> None:
     logger.info("Found %d items in reading list", len(reading_list))
 
     # Generate RSS feed
-    output_path = "example_feed.xml"
-    success = generate_rss(
+    output_path = Path("example_feed.xml").resolve()
+    success, entry_count = generate_rss(
         items=reading_list,
         feed_path=output_path,
         feed_title="Example Reading List",
@@ -47,8 +47,8 @@ def example_basic_usage(logger: logging.Logger) -> None:
     )
 
     if success:
-        full_path = Path(output_path).resolve()
-        logger.info("RSS feed generated successfully: %s", full_path)
+        logger.info("RSS feed generated successfully: %s", output_path)
+        logger.info("Feed contains %d items", entry_count)
         logger.info("You can now use this RSS feed in your feed reader.")
     else:
         logger.error("Failed to generate RSS feed")
@@ -58,8 +58,8 @@ def example_custom_configuration(logger: logging.Logger) -> None:
     """Example with custom configuration."""
     logger.info("Starting custom configuration example...")
 
-    # Get configuration instance
-    config = Config()
+    # Get configuration
+    config = get_config()
 
     # Show current configuration
     logger.info("Current configuration:")
@@ -11,7 +11,7 @@ import sys
 from pathlib import Path
 from typing import NoReturn
 
-from make_feed.config import Config, configure_logging
+from make_feed.config import configure_logging, get_config
 from make_feed.generate_rss import generate_rss
 from make_feed.pull_notion import display_reading_list, fetch_reading_list
 
@@ -111,7 +111,7 @@ def main() -> NoReturn:
 
     try:
         # Validate configuration
-        config = Config()
+        config = get_config()
         config_errors = config.validate()
         if config_errors:
             logger.error("Configuration validation failed:")
@@ -146,19 +146,18 @@ def main() -> NoReturn:
 
         # Generate RSS feed
         logger.info("Generating RSS feed...")
-        success = generate_rss(
+        output_path = Path(args.output).resolve()
+        success, entry_count = generate_rss(
             items=reading_list,
-            feed_path=args.output,
+            feed_path=output_path,
             feed_title=args.title,
             feed_description=args.description,
             feed_link=args.link,
         )
 
         if success:
-            output_path = Path(args.output).resolve()
             logger.info("RSS feed generated successfully: %s", output_path)
-            valid_items_count = len([item for item in reading_list if item.get("url")])
-            logger.info("Feed contains %d items", valid_items_count)
+            logger.info("Feed contains %d items", entry_count)
             sys.exit(0)
         else:
             logger.error("RSS feed generation failed")
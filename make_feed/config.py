@@ -1,54 +1,54 @@
 """Configuration management for Notion RSS Feed Generator."""
 
+import atexit
 import logging
 import os
+import queue
+import warnings
+from dataclasses import dataclass
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from dotenv import find_dotenv, load_dotenv
 
-if not find_dotenv():
-    print("Warning: .env file not found. Environment variables may be missing.")  # noqa: T201
+# Search for the .env file once and hand the result to load_dotenv, which would
+# otherwise repeat the search
+dotenv_path = find_dotenv()
+if dotenv_path:
+    load_dotenv(dotenv_path, override=False)
 else:
-    load_dotenv()
+    warnings.warn(
+        ".env file not found. Environment variables may be missing.", stacklevel=1
+    )
+
+# Log file rotation settings
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUP_COUNT = 3
+
+# Listeners forwarding queued log records to the real handlers
+_queue_listeners: list[QueueListener] = []
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration settings for the RSS feed generator.
 
-    Loads environment variables and provides validation for required settings.
-    Uses singleton pattern to ensure consistent configuration across the application.
+    Holds the values loaded from environment variables and provides validation
+    for required settings. Use ``get_config`` to obtain the shared instance.
     """
 
-    _instance: "Config | None" = None
-
-    def __new__(cls) -> "Config":
-        """Create or return existing singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.initialized = False  # just created, not initialized
-        return cls._instance
-
-    def __init__(self) -> None:
-        """Initialize configuration by loading environment variables."""
-        # Prevent re-initialization of singleton
-        if getattr(self, "initialized", False):
-            return
-
-        self.NOTION_API_KEY: str = os.getenv("NOTION_API_KEY", "")
-        self.NOTION_DATABASE_ID: str = os.getenv("NOTION_DATABASE_ID", "")
+    NOTION_API_KEY: str
+    NOTION_DATABASE_ID: str
 
-        # RSS Feed Configuration
-        self.RSS_FEED_PATH: str = os.getenv("RSS_FEED_PATH", "notion_reading_list.xml")
-        self.RSS_FEED_TITLE: str = os.getenv("RSS_FEED_TITLE", "Notion Reading List")
-        self.RSS_FEED_DESCRIPTION: str = os.getenv(
-            "RSS_FEED_DESCRIPTION", "My personal reading list collected in Notion"
-        )
-        self.RSS_FEED_LINK: str | None = os.getenv("RSS_FEED_LINK")
-
-        # Logging Configuration
-        self.LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    # RSS Feed Configuration
+    RSS_FEED_PATH: str
+    RSS_FEED_TITLE: str
+    RSS_FEED_DESCRIPTION: str
+    RSS_FEED_LINK: str | None
 
-        self.initialized = True
+    # Logging Configuration
+    LOG_LEVEL: str
 
     def validate(self) -> list[str]:
         """Validate required configuration settings.
@@ -63,16 +63,36 @@ class Config:
             errors.append("NOTION_DATABASE_ID is required")
         return errors
 
-    @classmethod
-    def get_instance(cls) -> "Config":
-        """Get the singleton configuration instance.
 
-        Returns:
-            The singleton Config instance.
-        """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Load the configuration from environment variables.
+
+    The result is cached, so every caller shares the same instance.
+
+    Returns:
+        The application Config instance.
+    """
+    return Config(
+        NOTION_API_KEY=os.getenv("NOTION_API_KEY", ""),
+        NOTION_DATABASE_ID=os.getenv("NOTION_DATABASE_ID", ""),
+        RSS_FEED_PATH=os.getenv("RSS_FEED_PATH", "notion_reading_list.xml"),
+        RSS_FEED_TITLE=os.getenv("RSS_FEED_TITLE", "Notion Reading List"),
+        RSS_FEED_DESCRIPTION=os.getenv(
+            "RSS_FEED_DESCRIPTION", "My personal reading list collected in Notion"
+        ),
+        RSS_FEED_LINK=os.getenv("RSS_FEED_LINK"),
+        LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+    )
+
+
+def _stop_queue_listeners() -> None:
+    """Stop running queue listeners, flushing any records still queued."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+atexit.register(_stop_queue_listeners)
 
 
 def configure_logging(
@@ -99,15 +119,22 @@ def configure_logging(
     else:
         # Try to get from config, fallback to INFO
         try:
-            config = Config.get_instance()
+            config = get_config()
             level = getattr(logging, config.LOG_LEVEL.upper(), logging.INFO)
         except (AttributeError, ValueError):
             level = logging.INFO
 
+    # Skip collecting record attributes the log format never uses
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None  # noqa: SLF001 - avoids a stack walk per record
+
     # Clear existing handlers to avoid duplication
     root_logger = logging.getLogger()
     if root_logger.hasHandlers():
         root_logger.handlers.clear()
+    _stop_queue_listeners()
 
     # Configure handlers
     handlers: list[logging.Handler] = [logging.StreamHandler()]
@@ -115,13 +142,23 @@ def configure_logging(
     if log_to_file:
         log_dir = Path(log_file_path).parent
         log_dir.mkdir(exist_ok=True)
-        file_handler = logging.FileHandler(log_file_path)
+        file_handler = RotatingFileHandler(
+            log_file_path, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT
+        )
         handlers.append(file_handler)
 
-    # Set up logging configuration
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    formatter = logging.Formatter(
+        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=handlers,
     )
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Hand records to a background thread so callers never wait on handler I/O
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners.append(listener)
+
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
@@ -1,167 +1,307 @@
+import hashlib
 import logging
+import os
+from collections.abc import Iterable
 from datetime import UTC, datetime
+from email.utils import format_datetime
 from pathlib import Path
+from typing import BinaryIO
 
-from feedgen.feed import FeedGenerator
+import orjson
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
 
-def create_feed_description(item: dict[str, str | None]) -> str:
-    """Create a rich HTML description for the RSS feed entry.
+
+def parse_timestamp(timestamp: str | None) -> datetime | None:
+    """Parse an ISO format timestamp.
 
     Args:
-        item: Dictionary containing item information from Notion
+        timestamp: ISO format timestamp string
 
     Returns:
-        HTML-formatted description string
+        Parsed datetime object, or None if it is missing or cannot be parsed
     """
-    description_parts = []
-
-    # Add comments if available
-    if item.get("comments"):
-        description_parts.append(f"<p><strong>Comments:</strong> {item['comments']}</p>")
-
-    # Add tags if available
-    if item.get("tags"):
-        description_parts.append(f"<p><strong>Tags:</strong> {item['tags']}</p>")
-
-    # Add status if available
-    if item.get("status"):
-        description_parts.append(f"<p><strong>Status:</strong> {item['status']}</p>")
-
-    # Add creation date
-    if item.get("created_time"):
-        try:
-            created_date = datetime.fromisoformat(item["created_time"])
-            formatted_date = created_date.strftime("%Y-%m-%d %H:%M:%S UTC")
-            description_parts.append(f"<p><strong>Added:</strong> {formatted_date}</p>")
-        except (ValueError, AttributeError) as e:
-            logger.warning("Failed to parse created_time: %s", e)
-
-    return (
-        "".join(description_parts)
-        if description_parts
-        else "<p>No additional information available.</p>"
-    )
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError) as e:
+        logger.warning("Failed to parse timestamp '%s': %s", timestamp, e)
+        return None
 
 
-def parse_publication_date(created_time: str | None) -> datetime:
-    """Parse publication date from created_time string.
+def create_feed_description(
+    item: dict[str, str | None], created_date: datetime | None
+) -> str:
+    """Create a rich HTML description for the RSS feed entry.
 
     Args:
-        created_time: ISO format timestamp string
+        item: Dictionary containing item information from Notion
+        created_date: Parsed creation time of the item, if known
 
     Returns:
-        Parsed datetime object or current time if parsing fails
+        HTML-formatted description string
     """
-    if not created_time:
-        return datetime.now(tz=UTC)
-
-    try:
-        return datetime.fromisoformat(created_time)
-    except (ValueError, AttributeError) as e:
-        logger.warning("Failed to parse publication date: %s", e)
-        return datetime.now(tz=UTC)
+    comments = item.get("comments")
+    tags = item.get("tags")
+    status = item.get("status")
+    added = created_date.strftime("%Y-%m-%d %H:%M:%S UTC") if created_date else None
+
+    description = "".join(
+        (
+            f"<p><strong>Comments:</strong> {comments}</p>" if comments else "",
+            f"<p><strong>Tags:</strong> {tags}</p>" if tags else "",
+            f"<p><strong>Status:</strong> {status}</p>" if status else "",
+            f"<p><strong>Added:</strong> {added}</p>" if added else "",
+        )
+    )
+    return description or "<p>No additional information available.</p>"
 
 
-def create_feed_entry(fg: FeedGenerator, item: dict[str, str | None]) -> bool:
+def create_feed_entry(item: dict[str, str | None]) -> etree._Element | None:
     """Create a single RSS feed entry.
 
     Args:
-        fg: FeedGenerator instance
         item: Item data from Notion
 
     Returns:
-        True if entry was created successfully, False otherwise
+        The ``<item>`` element if it was created successfully, None otherwise
     """
     try:
-        fe = fg.add_entry()
-        fe.id(item["url"])
-        fe.title(item.get("title", "Untitled"))
-        fe.link(href=item["url"])
+        entry = etree.Element("item")
+        etree.SubElement(entry, "title").text = item.get("title") or "Untitled"
+        etree.SubElement(entry, "link").text = item["url"]
+
+        # Parse the creation time once for both the description and pubDate
+        created_date = parse_timestamp(item.get("created_time"))
 
         # Create rich description
-        description = create_feed_description(item)
-        fe.description(description)
+        description = create_feed_description(item, created_date)
+        etree.SubElement(entry, "description").text = etree.CDATA(description)
+
+        etree.SubElement(entry, "guid", isPermaLink="false").text = item["url"]
 
-        # Set publication date
-        pub_date = parse_publication_date(item.get("created_time"))
-        fe.published(pub_date)
+        # Set publication date, falling back to now when unknown
+        pub_date = created_date or datetime.now(tz=UTC)
+        etree.SubElement(entry, "pubDate").text = format_datetime(pub_date)
 
-    except (ValueError, KeyError, AttributeError):
+    except (ValueError, KeyError, AttributeError, TypeError):
         logger.exception("Failed to process item '%s'", item.get("title", "Unknown"))
-        return False
+        return None
     else:
-        return True
+        return entry
+
+
+def create_channel_header(
+    feed_title: str, feed_description: str, feed_link: str
+) -> list[etree._Element]:
+    """Create the channel metadata elements that precede the feed entries.
+
+    Args:
+        feed_title: Title of the RSS feed
+        feed_description: Description of the RSS feed
+        feed_link: Self-referencing link for the feed
+
+    Returns:
+        List of channel-level elements in document order
+    """
+    fields = (
+        ("title", feed_title),
+        ("link", feed_link),
+        ("description", feed_description),
+        ("docs", "http://www.rssboard.org/rss-specification"),
+        ("generator", "make_feed"),
+        ("language", "en"),
+        ("managingEditor", "noreply@example.com (Notion RSS Generator)"),
+        ("lastBuildDate", format_datetime(datetime.now(tz=UTC))),
+    )
+    elements = []
+    for tag, text in fields:
+        element = etree.Element(tag)
+        element.text = text
+        elements.append(element)
+
+    atom_link = etree.Element(
+        f"{{{ATOM_NAMESPACE}}}link",
+        href=feed_link,
+        rel="self",
+        nsmap={"atom": ATOM_NAMESPACE},
+    )
+    elements.append(atom_link)
+
+    return elements
+
+
+def write_feed(
+    feed_file: BinaryIO,
+    header: list[etree._Element],
+    entries: Iterable[etree._Element | None],
+) -> int:
+    """Stream the channel metadata and feed entries to an open file.
+
+    Args:
+        feed_file: Binary file object the RSS document is written to
+        header: Channel-level elements written before the entries
+        entries: Feed entries, None for items that could not be processed
+
+    Returns:
+        Number of entries written to the feed
+    """
+    successful_entries = 0
+    with etree.xmlfile(feed_file, encoding="utf-8") as xf:
+        xf.write_declaration()
+        with (
+            xf.element("rss", version="2.0", nsmap={"atom": ATOM_NAMESPACE}),
+            xf.element("channel"),
+        ):
+            for element in header:
+                xf.write(element)
+
+            for entry in entries:
+                if entry is not None:
+                    xf.write(entry)
+                    successful_entries += 1
+
+    return successful_entries
+
+
+def sync_file(file: BinaryIO) -> None:
+    """Flush a written file to disk.
+
+    The feed is fsynced so the rename that publishes it never exposes a
+    partially written feed after a crash.
+
+    Args:
+        file: File object that was just written, still open
+    """
+    file.flush()
+    os.fsync(file.fileno())
+
+
+def compute_feed_signature(
+    items: list[dict[str, str | None]], *channel_fields: str
+) -> str:
+    """Compute a signature that changes whenever the generated feed would.
+
+    Every field of every item is hashed, so the signature also tracks items
+    that carry no ``last_edited_time``.
+
+    Args:
+        items: Reading list items with valid URLs
+        *channel_fields: Channel-level values (title, description, link)
+
+    Returns:
+        Hex digest identifying the feed content
+    """
+    entries = sorted(orjson.dumps(item, option=orjson.OPT_SORT_KEYS) for item in items)
+    channel = orjson.dumps(channel_fields)
+    return hashlib.blake2b(b"\n".join([channel, *entries])).hexdigest()
+
+
+def read_feed_signature(signature_path: Path) -> tuple[str, int] | None:
+    """Read the signature stored alongside a previously generated feed.
+
+    The signature file holds the feed signature on its first line and the
+    number of entries written to the feed on its second.
+
+    Args:
+        signature_path: Path to the signature file
+
+    Returns:
+        Tuple of (signature, entry count), or None if it cannot be read
+    """
+    try:
+        signature, entry_count = signature_path.read_text(encoding="utf-8").split()
+        return signature, int(entry_count)
+    except (OSError, ValueError):
+        return None
 
 
 def generate_rss(
     items: list[dict[str, str | None]],
-    feed_path: str = "notion_reading_list.xml",
+    feed_path: str | Path = "notion_reading_list.xml",
     feed_title: str = "Notion Reading List",
     feed_description: str = "My personal reading list collected in Notion",
     feed_link: str | None = None,
-) -> bool:
+) -> tuple[bool, int]:
     """Generate RSS feed from Notion reading list items.
 
+    Entries are built one at a time and streamed to disk with lxml's incremental
+    writer, so only a single ``<item>`` element is held in memory at once. If the
+    items and channel metadata match the signature recorded by the previous run,
+    the existing feed is left untouched.
+
     Args:
         items: List of reading list items from Notion
-        feed_path: Path where the RSS file will be saved
+        feed_path: Path where the RSS file will be saved. Pass an already
+            resolved Path to avoid converting it again.
         feed_title: Title of the RSS feed
         feed_description: Description of the RSS feed
         feed_link: Self-referencing link for the feed
 
     Returns:
-        True if RSS generation was successful, False otherwise
+        Tuple of whether RSS generation was successful and the number of entries
+        in the feed
     """
     if not items:
         logger.warning("No items provided for RSS generation")
-        return False
+        return False, 0
 
     # Filter items with URLs
     valid_items = [item for item in items if item.get("url")]
 
     if not valid_items:
         logger.warning("No items with valid URLs found")
-        return False
+        return False, 0
 
-    try:
-        # Initialize feed generator
-        fg = FeedGenerator()
-        fg.id("notion-reading-list")
-        fg.title(feed_title)
-        fg.description(feed_description)
-        fg.language("en")
-        fg.lastBuildDate(datetime.now(tz=UTC))
-
-        # Set feed link
-        if feed_link:
-            fg.link(href=feed_link, rel="self")
-        else:
-            fg.link(href=f"file://{Path(feed_path).absolute()}", rel="self")
-
-        # Add author information
-        fg.author({"name": "Notion RSS Generator", "email": "noreply@example.com"})
+    feed_path = Path(feed_path)
+
+    # Set feed link (absolute() is a no-op for an already resolved path)
+    if not feed_link:
+        feed_link = f"file://{feed_path.absolute()}"
 
+    # Skip regeneration when nothing changed since the last run
+    signature = compute_feed_signature(
+        valid_items, feed_title, feed_description, feed_link
+    )
+    signature_path = feed_path.with_name(f"{feed_path.name}.sig")
+    previous = read_feed_signature(signature_path)
+    if feed_path.exists() and previous is not None and previous[0] == signature:
+        logger.info("No changes since last run, keeping existing feed: %s", feed_path)
+        return True, previous[1]
+
+    tmp_feed_path = feed_path.with_name(f"{feed_path.name}.tmp")
+    tmp_signature_path = signature_path.with_name(f"{signature_path.name}.tmp")
+    try:
         logger.info("Processing %d valid items for RSS feed", len(valid_items))
 
-        # Add entries to feed
-        successful_entries = 0
-        for item in valid_items:
-            if create_feed_entry(fg, item):
-                successful_entries += 1
+        header = create_channel_header(feed_title, feed_description, feed_link)
+        entries = map(create_feed_entry, valid_items)
+        with tmp_feed_path.open("wb") as feed_file:
+            successful_entries = write_feed(feed_file, header, entries)
+            if successful_entries:
+                sync_file(feed_file)
 
         if successful_entries == 0:
             logger.error("No entries could be processed successfully")
-            return False
+            tmp_feed_path.unlink(missing_ok=True)
+            return False, 0
 
-        # Generate RSS file
-        fg.rss_file(feed_path)
+        # Publish the feed and its signature atomically
+        tmp_signature_path.write_text(
+            f"{signature}\n{successful_entries}\n", encoding="utf-8"
+        )
+        tmp_feed_path.replace(feed_path)
+        tmp_signature_path.replace(signature_path)
 
     except Exception:
         logger.exception("Failed to generate RSS feed")
-        return False
+        tmp_feed_path.unlink(missing_ok=True)
+        tmp_signature_path.unlink(missing_ok=True)
+        return False, 0
     else:
         logger.info("RSS feed successfully generated: %s", feed_path)
-        return True
+        return True, successful_entries
@@ -1,11 +1,265 @@
+import asyncio
 import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from http import HTTPStatus
+from typing import Any, cast
 
-from notion_client import APIResponseError, Client
+import aiohttp
+import httpx
+import orjson
+from notion_client import APIErrorCode, APIResponseError, Client
 
-from make_feed.config import Config
+from make_feed.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of results Notion returns per database query
+PAGE_SIZE = 100
+
+# Direct REST access used by the async fetcher
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+MAX_CONCURRENT_REQUESTS = 5
+MAX_RETRIES = 5
+KEEPALIVE_TIMEOUT = 60
+
+# Notion allows an average of three requests per second per integration
+RATE_LIMIT_REQUESTS = 3
+RATE_LIMIT_PERIOD = 1.0
+
+# One multi-line record per item instead of a record per field
+ITEM_DISPLAY_FORMAT = "\n".join(
+    (
+        "Title: %s",
+        "URL: %s",
+        "Status: %s",
+        "Tags: %s",
+        "Comments: %s",
+        "Created: %s",
+        "-" * 50,
+    )
+)
+
+
+class NotionRateLimiter:
+    """Sliding-window rate limiter shared by the sync and async Notion paths.
+
+    Each caller reserves the next free slot in the window and then sleeps until
+    that slot arrives, so bursts are spread out instead of being rejected.
+    """
+
+    def __init__(
+        self, max_requests: int = RATE_LIMIT_REQUESTS, period: float = RATE_LIMIT_PERIOD
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_requests: Maximum number of requests allowed per window
+            period: Length of the window in seconds
+        """
+        self.max_requests = max_requests
+        self.period = period
+        self._timestamps: deque[float] = deque()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve a request slot.
+
+        Returns:
+            Seconds to wait before the reserved slot starts
+        """
+        with self._lock:
+            now = time.monotonic()
+            while self._timestamps and self._timestamps[0] <= now - self.period:
+                self._timestamps.popleft()
+
+            slot = max(now, self._resume_at)
+            if len(self._timestamps) >= self.max_requests:
+                slot = max(slot, self._timestamps[-self.max_requests] + self.period)
+            self._timestamps.append(slot)
+            return slot - now
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        time.sleep(self._reserve())
+
+    async def acquire_async(self) -> None:
+        """Wait until a request may be sent without blocking the event loop."""
+        await asyncio.sleep(self._reserve())
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller after Notion reports that we are rate limited.
+
+        Args:
+            seconds: Time to wait before the next request, usually Retry-After
+        """
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+rate_limiter = NotionRateLimiter()
+
+
+class NotionClient(Client):
+    """Notion client that decodes successful responses with orjson.
+
+    Query responses are large, deeply nested documents, and orjson decodes them
+    considerably faster than the stdlib ``json`` module used by notion-client.
+    """
+
+    def _parse_response(self, response: httpx.Response) -> Any:  # noqa: ANN401
+        """Decode a response, deferring error handling to notion-client.
+
+        Args:
+            response: Raw HTTP response from the Notion API
+
+        Returns:
+            Decoded response body
+        """
+        if response.is_error:
+            return super()._parse_response(response)
+        return orjson.loads(response.content)
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    """Work out how long to wait before retrying a rate-limited request.
+
+    Args:
+        retry_after: Value of the ``Retry-After`` response header, if any
+        attempt: Zero-based index of the failed attempt
+
+    Returns:
+        Delay in seconds, falling back to exponential backoff
+    """
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            logger.debug("Ignoring non-numeric Retry-After header: %s", retry_after)
+    return float(2**attempt)
+
+
+def _first_plain_text(value: list[dict[str, Any]]) -> str:
+    """Return the plain text of the first rich text fragment."""
+    return str(value[0]["plain_text"])
+
+
+def _status_name(value: dict[str, Any]) -> str:
+    """Return the name of a status option."""
+    return str(value["name"])
+
+
+def _identity(value: str) -> str:
+    """Return the property value unchanged."""
+    return value
+
+
+# (item key, Notion property, property type, extractor, default when empty)
+FIELD_SPEC: tuple[tuple[str, str, str, Callable[[Any], str], str | None], ...] = (
+    ("title", "Name", "title", _first_plain_text, "No Title"),
+    ("url", "URL", "url", _identity, None),
+    ("comments", "Comments", "rich_text", _first_plain_text, ""),
+    ("tags", "Tags", "rich_text", _first_plain_text, ""),
+    ("status", "Status", "status", _status_name, ""),
+)
+
+
+def _extract_property(
+    prop: dict[str, Any] | None,
+    prop_type: str,
+    extract: Callable[[Any], str],
+    default: str | None,
+) -> str | None:
+    """Extract a single value from a Notion property object.
+
+    Args:
+        prop: Property object from the row, None if the row lacks it
+        prop_type: Key holding the typed value inside the property
+        extract: Function turning the typed value into a string
+        default: Value returned when the property is missing or empty
+
+    Returns:
+        Extracted value or the default
+    """
+    value = prop.get(prop_type) if prop else None
+    return extract(value) if value else default
+
+
+def _parse_row(row: dict[str, Any]) -> dict[str, str | None]:
+    """Extract reading list fields from a Notion database row.
+
+    Args:
+        row: Page object returned by a Notion database query
+
+    Returns:
+        Dictionary containing item information
+    """
+    props = row["properties"]
+    item = {
+        name: _extract_property(props.get(prop_name), prop_type, extract, default)
+        for name, prop_name, prop_type, extract, default in FIELD_SPEC
+    }
+    item["created_time"] = row["created_time"]
+    item["last_edited_time"] = row["last_edited_time"]
+    return item
+
+
+def _query_database(notion: Client, query: dict[str, Any]) -> dict[str, Any]:
+    """Query a Notion database page through the rate limiter.
+
+    Args:
+        notion: Authenticated Notion client
+        query: Keyword arguments for ``databases.query``
+
+    Returns:
+        Query response from the Notion client
+
+    Raises:
+        APIResponseError: If the query fails for a reason other than rate
+            limiting, or retries run out
+    """
+    attempt = 0
+    while True:
+        rate_limiter.acquire()
+        try:
+            return cast("dict[str, Any]", notion.databases.query(**query))
+        except APIResponseError as e:
+            if e.code != APIErrorCode.RateLimited or attempt >= MAX_RETRIES:
+                raise
+            delay = _retry_delay(e.headers.get("Retry-After"), attempt)
+
+        logger.warning("Rate limited by Notion, retrying in %.1f seconds", delay)
+        rate_limiter.pause(delay)
+        attempt += 1
+
+
+def iter_reading_list(
+    notion: Client, database_id: str
+) -> Iterator[dict[str, str | None]]:
+    """Lazily yield reading list items, following Notion's pagination cursors.
+
+    Notion returns at most ``PAGE_SIZE`` results per query, so the database is
+    walked page by page until ``has_more`` is false.
+
+    Args:
+        notion: Authenticated Notion client
+        database_id: ID of the database to query
+
+    Yields:
+        Dictionaries containing item information
+    """
+    query: dict[str, Any] = {"database_id": database_id, "page_size": PAGE_SIZE}
+    while True:
+        response = _query_database(notion, query)
+        yield from map(_parse_row, response["results"])
+        if not response["has_more"]:
+            break
+        query["start_cursor"] = response["next_cursor"]
+
 
 def fetch_reading_list() -> list[dict[str, str | None]]:
     """Fetch reading list from Notion database.
@@ -13,52 +267,10 @@ def fetch_reading_list() -> list[dict[str, str | None]]:
     Returns:
         List of dictionaries containing item information
     """
-    config = Config()
-    notion = Client(auth=config.NOTION_API_KEY)
+    config = get_config()
+    notion = NotionClient(auth=config.NOTION_API_KEY)
     try:
-        result = notion.databases.query(database_id=config.NOTION_DATABASE_ID)
-        items = []
-
-        for row in result["results"]:
-            props = row["properties"]
-
-            # Extract title from Name field
-            title = "No Title"
-            if props.get("Name", {}).get("title"):
-                title = props["Name"]["title"][0]["plain_text"]
-
-            # Extract URL
-            url = props.get("URL", {}).get("url")
-
-            # Extract comments/notes
-            comments = ""
-            if props.get("Comments", {}).get("rich_text"):
-                comments = props["Comments"]["rich_text"][0]["plain_text"]
-
-            # Extract tags
-            tags = ""
-            if props.get("Tags", {}).get("rich_text"):
-                tags = props["Tags"]["rich_text"][0]["plain_text"]
-
-            # Extract status
-            status = ""
-            if props.get("Status", {}).get("status"):
-                status = props["Status"]["status"]["name"]
-
-            # Extract created time
-            created_time = row["created_time"]
-
-            items.append(
-                {
-                    "title": title,
-                    "url": url,
-                    "comments": comments,
-                    "tags": tags,
-                    "status": status,
-                    "created_time": created_time,
-                }
-            )
-
+        items = list(iter_reading_list(notion, config.NOTION_DATABASE_ID))
     except APIResponseError:
         logger.exception("Error fetching reading list")
         return []
@@ -67,6 +279,119 @@ def fetch_reading_list() -> list[dict[str, str | None]]:
         return items
 
 
+async def _query_database_page(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    database_id: str,
+    start_cursor: str | None,
+) -> dict[str, Any]:
+    """Query a single page of a Notion database, retrying when rate limited.
+
+    Args:
+        session: Client session carrying the Notion auth headers
+        semaphore: Semaphore bounding the number of in-flight requests
+        database_id: ID of the database to query
+        start_cursor: Cursor returned by the previous page, None for the first
+
+    Returns:
+        Decoded query response
+    """
+    url = f"{NOTION_API_URL}/databases/{database_id}/query"
+    body: dict[str, Any] = {"page_size": PAGE_SIZE}
+    if start_cursor:
+        body["start_cursor"] = start_cursor
+
+    attempt = 0
+    while True:
+        await rate_limiter.acquire_async()
+        async with semaphore, session.post(url, json=body) as response:
+            rate_limited = response.status == HTTPStatus.TOO_MANY_REQUESTS
+            if not rate_limited or attempt >= MAX_RETRIES:
+                response.raise_for_status()
+                result: dict[str, Any] = await response.json(loads=orjson.loads)
+                return result
+            delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+
+        logger.warning("Rate limited by Notion, retrying in %.1f seconds", delay)
+        rate_limiter.pause(delay)
+        attempt += 1
+
+
+async def _fetch_database_async(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, database_id: str
+) -> list[dict[str, str | None]]:
+    """Fetch every row of a single database, following pagination cursors.
+
+    Args:
+        session: Client session carrying the Notion auth headers
+        semaphore: Semaphore bounding the number of in-flight requests
+        database_id: ID of the database to query
+
+    Returns:
+        List of dictionaries containing item information
+    """
+    items: list[dict[str, str | None]] = []
+    start_cursor = None
+    while True:
+        response = await _query_database_page(
+            session, semaphore, database_id, start_cursor
+        )
+        items.extend(map(_parse_row, response["results"]))
+        if not response["has_more"]:
+            return items
+        start_cursor = response["next_cursor"]
+
+
+async def fetch_reading_list_async(
+    database_ids: Sequence[str] | None = None,
+) -> list[dict[str, str | None]]:
+    """Fetch reading lists from one or more Notion databases concurrently.
+
+    Pagination cursors are opaque, so pages of a single database are still
+    fetched in order; the concurrency comes from querying several databases at
+    once over a shared keep-alive session.
+
+    Args:
+        database_ids: IDs of the databases to query. Defaults to the configured
+            NOTION_DATABASE_ID.
+
+    Returns:
+        List of dictionaries containing item information
+    """
+    config = get_config()
+    if not database_ids:
+        database_ids = [config.NOTION_DATABASE_ID]
+
+    headers = {
+        "Authorization": f"Bearer {config.NOTION_API_KEY}",
+        "Notion-Version": NOTION_VERSION,
+    }
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(
+        limit_per_host=MAX_CONCURRENT_REQUESTS, keepalive_timeout=KEEPALIVE_TIMEOUT
+    )
+    failed = False
+    try:
+        async with (
+            aiohttp.ClientSession(headers=headers, connector=connector) as session,
+            asyncio.TaskGroup() as group,
+        ):
+            # The task group cancels the remaining fetches if one of them fails
+            tasks = [
+                group.create_task(_fetch_database_async(session, semaphore, db_id))
+                for db_id in database_ids
+            ]
+    except* (aiohttp.ClientError, TimeoutError):
+        logger.exception("Error fetching reading list")
+        failed = True
+    if failed:
+        return []
+
+    items = [item for task in tasks for item in task.result()]
+    logger.info("Successfully fetched %d items from reading list", len(items))
+    return items
+
+
 def display_reading_list(items: list[dict[str, str | None]]) -> None:
     """Display reading list items in a formatted way.
 
@@ -74,10 +399,12 @@ def display_reading_list(items: list[dict[str, str | None]]) -> None:
         items: List of reading list items to display
     """
     for item in items:
-        logger.info("Title: %s", item["title"])
-        logger.info("URL: %s", item["url"])
-        logger.info("Status: %s", item["status"])
-        logger.info("Tags: %s", item["tags"])
-        logger.info("Comments: %s", item["comments"])
-        logger.info("Created: %s", item["created_time"])
-        logger.info("-" * 50)
+        logger.info(
+            ITEM_DISPLAY_FORMAT,
+            item["title"],
+            item["url"],
+            item["status"],
+            item["tags"],
+            item["comments"],
+            item["created_time"],
+        )
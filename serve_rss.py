@@ -6,21 +6,270 @@ for local consumption by FreshRSS or other feed readers.
 """
 
 import argparse
+import gzip
+import hashlib
 import http.server
+import io
 import os
-import socketserver
+import shutil
 import sys
+import threading
+from dataclasses import dataclass
+from datetime import UTC
+from email.utils import formatdate, parsedate_to_datetime
+from functools import partial
+from http import HTTPStatus
 from pathlib import Path
+from typing import Any, BinaryIO, override
 
 # Constants
 ADDRESS_ALREADY_IN_USE_ERRNO = 98
+CACHE_MAX_AGE = 300
+GZIP_COMPRESS_LEVEL = 6
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedFile:
+    """Validators and gzipped body of one version of a served file."""
+
+    inode: int
+    mtime_ns: int
+    size: int
+    etag: str
+    last_modified: str
+    gzipped: bytes
+
+
+# Latest encoded version of the feed, refreshed when the file changes
+_encoded_files: dict[str, EncodedFile] = {}
+_encoded_files_lock = threading.Lock()
+
+
+def load_encoded_file(file: BinaryIO, path: str) -> EncodedFile:
+    """Return the validators and gzipped body of an open file.
+
+    The file is only hashed and compressed when it differs from the cached
+    version. Everything is derived from the open descriptor, so the ETag always
+    describes the bytes that will be sent from it.
+
+    Args:
+        file: File being served, positioned at its start
+        path: Filesystem path of the file, used as the cache key
+
+    Returns:
+        The encoded version of the file
+    """
+    stat = os.fstat(file.fileno())
+    with _encoded_files_lock:
+        cached = _encoded_files.get(path)
+    # The feed is republished with os.replace, so a new version has a new inode
+    version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    if cached and (cached.inode, cached.mtime_ns, cached.size) == version:
+        return cached
+
+    # Hash and compress outside the lock so other requests are not held up
+    data = file.read()
+    file.seek(0)
+    encoded = EncodedFile(
+        inode=stat.st_ino,
+        mtime_ns=stat.st_mtime_ns,
+        size=len(data),
+        etag=f'W/"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"',
+        last_modified=formatdate(stat.st_mtime, usegmt=True),
+        gzipped=gzip.compress(data, compresslevel=GZIP_COMPRESS_LEVEL),
+    )
+    with _encoded_files_lock:
+        _encoded_files[path] = encoded
+    return encoded
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding request header
+
+    Returns:
+        True if gzip (or ``*``) is listed with a non-zero quality value
+    """
+    qualities: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, *params = (part.strip() for part in coding.split(";"))
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+class RSSRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler with ETag revalidation, gzip and sendfile support.
+
+    ETags and gzip are only used for the feed; other files in the served
+    directory are left to the base handler and sent with sendfile.
+    """
+
+    encoded: EncodedFile | None = None
+
+    def __init__(self, *args: Any, feed_path: Path, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the handler.
+
+        Args:
+            *args: Positional arguments for the base handler
+            feed_path: Absolute path of the RSS feed file
+            **kwargs: Keyword arguments for the base handler
+        """
+        self.feed_path = feed_path
+        super().__init__(*args, **kwargs)
+
+    @override
+    def send_head(self) -> io.BytesIO | BinaryIO | None:
+        """Send the headers for a GET or HEAD request.
+
+        An unchanged feed is answered with 304 and gzip-capable clients get the
+        cached compressed body. Every other path is left to the base handler.
+
+        Returns:
+            The body to copy to the client, or None if there is none
+        """
+        self.encoded = None
+        path = self.translate_path(self.path)
+        if path.endswith("/") or Path(path) != self.feed_path:
+            return super().send_head()
+
+        try:
+            file = Path(path).open("rb")  # noqa: SIM115 - closed by the caller
+        except OSError:
+            return super().send_head()
+
+        try:
+            return self.send_file_head(file, path)
+        except BaseException:
+            file.close()
+            raise
+
+    def send_file_head(self, file: BinaryIO, path: str) -> io.BytesIO | BinaryIO | None:
+        """Send the headers for an open regular file.
+
+        Args:
+            file: The requested file, opened for reading
+            path: Filesystem path of the file
+
+        Returns:
+            The body to copy to the client, or None for a 304 response. The
+            file is closed here whenever it is not returned.
+        """
+        self.encoded = load_encoded_file(file, path)
+        if self.is_not_modified(self.encoded):
+            file.close()
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.end_headers()
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", self.guess_type(path))
+        if accepts_gzip(self.headers.get("Accept-Encoding", "")):
+            file.close()
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(self.encoded.gzipped)))
+            self.end_headers()
+            return io.BytesIO(self.encoded.gzipped)
+
+        # Plain responses are copied from the same descriptor with sendfile
+        self.send_header("Content-Length", str(self.encoded.size))
+        self.end_headers()
+        return file
+
+    def is_not_modified(self, encoded: EncodedFile) -> bool:
+        """Check the request's conditional headers against the served file.
+
+        If-Modified-Since is only consulted when If-None-Match is absent.
+
+        Args:
+            encoded: The encoded version of the requested file
+
+        Returns:
+            True if the client's cached copy is still current
+        """
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or encoded.etag.removeprefix("W/") in tags
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return encoded.mtime_ns // 1_000_000_000 <= since.timestamp()
+
+    @override
+    def send_response(self, code: int, message: str | None = None) -> None:
+        """Send the response status, letting feed readers cache successful hits.
+
+        Args:
+            code: HTTP status code
+            message: Optional reason phrase
+        """
+        super().send_response(code, message)
+        if code in {HTTPStatus.OK, HTTPStatus.NOT_MODIFIED}:
+            self.send_header("Cache-Control", f"max-age={CACHE_MAX_AGE}")
+            if self.encoded:
+                self.send_header("ETag", self.encoded.etag)
+                self.send_header("Last-Modified", self.encoded.last_modified)
+                self.send_header("Vary", "Accept-Encoding")
+
+    @override
+    def copyfile(self, source: BinaryIO, outputfile: BinaryIO) -> None:  # type: ignore[override]
+        """Copy the file to the socket in the kernel when possible.
+
+        Args:
+            source: File being served
+            outputfile: Stream connected to the client
+
+        Raises:
+            OSError: If sendfile fails after part of the body was already sent
+        """
+        if not hasattr(os, "sendfile"):
+            shutil.copyfileobj(source, outputfile)
+            return
+
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+            offset = source.tell()
+            size = os.fstat(in_fd).st_size
+        except (AttributeError, OSError):
+            # In-memory bodies such as directory listings have no descriptor
+            shutil.copyfileobj(source, outputfile)
+            return
+
+        start = offset
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset != start:
+                raise
+            # Not every file system and socket supports sendfile
+            source.seek(start)
+            shutil.copyfileobj(source, outputfile)
 
 
 def serve_rss(
-    *,
-    port: int = 8080,
-    directory: str = ".",
-    feed_file: str = "notion_reading_list.xml",
+    *, port: int = 8080, directory: str = ".", feed_file: str = "notion_reading_list.xml"
 ) -> None:
     """Serve RSS feed via HTTP server.
 
@@ -41,11 +290,11 @@ def serve_rss(
         sys.stderr.write(f"Warning: RSS feed file {feed_path} does not exist yet\n")
         sys.stderr.write("Generate it first with: python main.py\n")
 
-    # Create HTTP server
-    handler = http.server.SimpleHTTPRequestHandler
+    # Create HTTP server, handling each connection in its own thread
+    handler = partial(RSSRequestHandler, feed_path=feed_path)
 
     try:
-        with socketserver.TCPServer(("", port), handler) as httpd:
+        with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
             sys.stdout.write(f"Server started at http://localhost:{port}/\n")
             sys.stdout.write(f"RSS Feed URL: http://localhost:{port}/{feed_file}\n")
             sys.stdout.write("Press Ctrl+C to stop the server\n")
@@ -69,11 +318,7 @@ def serve_rss(
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Serve RSS feeds locally")
     parser.add_argument(
-        "--port",
-        "-p",
-        type=int,
-        default=8080,
-        help="Port to serve on (default: 8080)",
+        "--port", "-p", type=int, default=8080, help="Port to serve on (default: 8080)"
     )
     parser.add_argument(
         "--directory",
@@ -92,8 +337,4 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    serve_rss(
-        port=args.port,
-        directory=args.directory,
-        feed_file=args.feed_file,
-    )
+    serve_rss(port=args.port, directory=args.directory, feed_file=args.feed_file)